@@ -1,11 +1,30 @@
 import json
+import argparse
+import functools
+import diskcache
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from urllib3.util.retry import Retry
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    # The lexbor backend; selectolax.parser (Modest) is gone as of 1.0
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # fall back to BeautifulSoup for search result pages
+    HTMLParser = None
 from pathlib import Path
 from datetime import datetime, timezone
 import re
+import bisect
+import heapq
 import urllib.parse
 import time
+import os
+import multiprocessing
+import threading
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # ----------------------------
 # CONFIG
@@ -15,10 +34,218 @@ INPUT_FILE = Path("data/conferences.json")
 OUTPUT_DIR = Path("generated")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Search results and scraped pages are cached on disk between runs
+CACHE_DIR = Path(".cache/fetch")
+CACHE_TTL = 24 * 60 * 60  # seconds
+CACHE = diskcache.Cache(str(CACHE_DIR))
+
+# HTTP responses are cached by ETag / Last-Modified, so unchanged pages
+# come back as empty 304s on later runs
+HTTP_CACHE_DIR = Path(".http_cache")
+
+# Stable CFP URLs for well-known conferences; {year} is the full year and
+# {yy} its last two digits
+KNOWN_HOMEPAGES = {
+    "OSDI": "https://www.usenix.org/conference/osdi{yy}/call-for-papers",
+    "SOSP": "https://sigops.org/s/conferences/sosp/{year}/cfp.html",
+    "ASPLOS": "https://www.asplos-conference.org/call-for-papers-asplos{yy}/",
+    "EuroSys": "https://{year}.eurosys.org/cfp.html",
+    "USENIX ATC": "https://www.usenix.org/conference/atc{yy}/call-for-papers",
+    "FAST": "https://www.usenix.org/conference/fast{yy}/call-for-papers",
+}
+
+# Responses that mean a candidate URL will never be a CFP page
+DEAD_PAGE_STATUSES = (404, 410)
+
+# Upper bounds on how much of a CFP page is downloaded and scanned
+MAX_PAGE_BYTES = 500_000
+MAX_TEXT_CHARS = 200_000
+
+# Stop scanning a page once this many future submission deadlines are found
+MAX_FUTURE_DEADLINES = 5
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+# Shared session: reuses connections (keep-alive) across requests to the
+# same host, retries transient failures / throttling with backoff and
+# revalidates cached pages instead of re-downloading them
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = CacheControlAdapter(
+    cache=FileCache(str(HTTP_CACHE_DIR)),
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Concurrency: conferences are processed in parallel, but at most
+# MAX_CONNECTIONS requests are in flight overall and MAX_PER_HOST per host,
+# and requests to the same host start at least MIN_HOST_INTERVAL apart
+MAX_WORKERS = 16
+MAX_CONNECTIONS = 100
+MAX_PER_HOST = 4
+MIN_HOST_INTERVAL = 0.5  # seconds
+# Candidate URLs probed at once per conference; the rest wait their turn
+# and are dropped once a result is accepted
+MAX_PROBE_WORKERS = 3
+
+# Process pool for page parsing, created by main()
+_parse_pool = None
+
+_log_state = threading.local()
+_print_lock = threading.Lock()
+
+# ----------------------------
+# PATTERNS
+# ----------------------------
+
+MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+
+# Date formats seen on CFP pages: "5 May 2025", "May 5, 2025", "2025-05-05".
+# Whitespace inside a date never includes a newline, so a scan over a whole
+# page only finds dates that sit within a single line
+DATE_PAT_1 = re.compile(rf'(\d{{1,2}})[^\S\n]+({MONTHS})[a-z]*,?[^\S\n]+(\d{{4}})', re.IGNORECASE)
+DATE_PAT_2 = re.compile(rf'({MONTHS})[a-z]*[^\S\n]+(\d{{1,2}}),?[^\S\n]+(\d{{4}})', re.IGNORECASE)
+DATE_PAT_3 = re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})')
+DATE_PATTERNS = (DATE_PAT_1, DATE_PAT_2, DATE_PAT_3)
+
+ISO_DATE_PAT = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}')
+
+# strptime formats, most common on CFP pages first
+DATE_FORMATS = (
+    "%d %B %Y", "%B %d %Y",
+    "%d %b %Y", "%b %d %Y",
+    "%d-%B-%Y", "%d-%b-%Y",
+    "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
+    "%A, %d %B %Y", "%A, %B %d %Y",
+)
+# The only formats a DATE_PART_PATTERNS match can be in
+SPACED_DATE_FORMATS = DATE_FORMATS[:4]
+
+# Loose "day month year" / "month day year" fragments inside a longer string
+DATE_PART_PATTERNS = (
+    re.compile(r"(\d{1,2}\s+\w+\s+\d{4})"),
+    re.compile(r"(\w+\s+\d{1,2}\s+\d{4})"),
+)
+
+LOCATION_PATTERNS = (
+    re.compile(r"(?:Location|Venue|City|Place)[:\-\s]+([A-Z][A-Za-z\s,]+(?:,\s*[A-Z]{2,})?)"),
+    re.compile(r"(?:held in|taking place in|will be in)\s+([A-Z][A-Za-z\s,]+)"),
+)
+
+# Keywords that classify the dates found on the same line
+ABSTRACT_KEYWORDS = ["abstract", "abstract deadline", "abstract due", "abstract submission", "paper abstract submission deadline"]
+SUBMISSION_KEYWORDS = ["submission deadline", "paper deadline", "full paper", "paper due", "submission due", "submissions due", "deadline:", "paper submission"]
+CONF_KEYWORDS = ["conference date", "event date", "will be held", "taking place", "conference:", "dates:"]
+
+ABSTRACT_KW_PAT = re.compile("|".join(map(re.escape, ABSTRACT_KEYWORDS)))
+SUBMISSION_KW_PAT = re.compile("|".join(map(re.escape, SUBMISSION_KEYWORDS)))
+CONF_KW_PAT = re.compile("|".join(map(re.escape, CONF_KEYWORDS)))
+
+# Years are matched between non-digits so 'podc2026' and 'ipdps2026' count too
+YEAR_PAT = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+UDDG_PAT = re.compile(r'uddg=([^&]+)')
+NON_NAME_CHARS_PAT = re.compile(r'[^\w\s-]')
+WHITESPACE_PAT = re.compile(r'\s+')
+
+# Search result pages are parsed with only the tags that carry result links
+# (used when selectolax is not installed). Strainers match on tag name only:
+# a class_ filter here must equal the whole class attribute, so results
+# with extra classes would be lost; classes are checked by the selectors
+BING_STRAINER = SoupStrainer(['li', 'cite'])
+ANCHOR_STRAINER = SoupStrainer('a')
+
 # ----------------------------
 # UTILITIES
 # ----------------------------
 
+def cache_get(key):
+    """Read a JSON value from the disk cache, or None on a miss"""
+    raw = CACHE.get(key)
+    return None if raw is None else orjson.loads(raw)
+
+
+def cache_set(key, value):
+    """Store a JSON-serializable value in the disk cache for CACHE_TTL"""
+    CACHE.set(key, orjson.dumps(value), expire=CACHE_TTL)
+
+
+def log(msg=""):
+    """Print a line, or buffer it if the current thread is collecting output"""
+    lines = getattr(_log_state, "lines", None)
+    if lines is None:
+        print(msg)
+    else:
+        lines.append(msg)
+
+
+class RateLimiter:
+    """Caps the number of concurrent requests, overall and per host, and
+    spaces out the start of requests to the same host"""
+    
+    def __init__(self, limit, limit_per_host, min_interval=0.0):
+        self.limit_per_host = limit_per_host
+        self.min_interval = min_interval
+        self._total = threading.BoundedSemaphore(limit)
+        self._hosts = {}
+        self._next_start = {}
+        self._lock = threading.Lock()
+    
+    def _host_slot(self, host):
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.limit_per_host)
+            return self._hosts[host]
+    
+    def _wait_turn(self, host):
+        # Reserve the next start time for this host under the lock, then
+        # sleep outside it so other hosts are not held up
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+    
+    @contextlib.contextmanager
+    def slot(self, url):
+        """Hold a request slot for the host of url"""
+        host = urllib.parse.urlparse(url).netloc
+        # Wait on the host first so a busy host does not tie up global slots
+        with self._host_slot(host):
+            self._wait_turn(host)
+            with self._total:
+                yield
+
+
+LIMITER = RateLimiter(MAX_CONNECTIONS, MAX_PER_HOST, MIN_HOST_INTERVAL)
+
+
+class FetchCancelled(Exception):
+    """Raised by fetch when its stop event is set before the request is sent"""
+
+
+def fetch(url, stop=None, **kwargs):
+    """GET a URL through the shared session, subject to LIMITER"""
+    def stopped():
+        return stop is not None and stop.is_set()
+    
+    if stopped():
+        raise FetchCancelled(url)
+    with LIMITER.slot(url):
+        # Waiting for the slot may take a while; re-check before sending
+        if stopped():
+            raise FetchCancelled(url)
+        return SESSION.get(url, **kwargs)
+
+
+@functools.lru_cache(maxsize=4096)
 def clean_url(url):
     """Clean and validate URL"""
     if not url or url == "TBA":
@@ -26,7 +253,7 @@ def clean_url(url):
     
     # Remove DuckDuckGo redirect wrapper
     if 'uddg=' in url:
-        match = re.search(r'uddg=([^&]+)', url)
+        match = UDDG_PAT.search(url)
         if match:
             url = urllib.parse.unquote(match.group(1))
     
@@ -47,137 +274,162 @@ def clean_url(url):
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def update_year_in_url(url, new_year):
     """Update year references in URL"""
     if not url:
         return url
     
     # Find all 4-digit years in the URL
-    current_years = re.findall(r'\b(20\d{2})\b', url)
+    current_years = set(YEAR_PAT.findall(url))
     if not current_years:
         return url
     
     # Replace with new year
-    for old_year in set(current_years):
-        url = url.replace(old_year, str(new_year))
+    url = YEAR_PAT.sub(str(new_year), url)
     
-    # Also handle 2-digit years
-    for old_year in set(current_years):
-        old_short = old_year[2:]
-        new_short = str(new_year)[2:]
-        url = url.replace(old_short, new_short)
+    # Also handle 2-digit years, but only as standalone numbers so that
+    # ports, IDs and other digit runs are left alone
+    short_years = "|".join(sorted(year[2:] for year in current_years))
+    url = re.sub(rf'(?<!\d)(?:{short_years})(?!\d)', str(new_year)[2:], url)
     
     return url
 
 
-def search_bing(query, num_results=8):
+@functools.lru_cache(maxsize=4096)
+def canonicalize_url(url):
+    """
+    Canonical form of a URL for duplicate detection, or None if invalid
+    Scheme, letter case, 'www.', default ports and trailing slashes are ignored
+    """
+    cleaned = clean_url(url)
+    if not cleaned:
+        return None
+    
+    parts = urllib.parse.urlsplit(cleaned)
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+    host = (parts.hostname or '').removeprefix('www.')
+    if not host:
+        return None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    
+    return urllib.parse.urlunsplit(('https', host, parts.path.rstrip('/') or '/', parts.query, ''))
+
+
+def dedupe_urls(urls):
+    """Clean URLs and drop duplicates by canonical form, keeping the first of each"""
+    seen = set()
+    unique_urls = []
+    for url in urls:
+        key = canonicalize_url(url)
+        if key and key not in seen:
+            seen.add(key)
+            unique_urls.append(clean_url(url))
+    return unique_urls
+
+
+def select_hrefs(content, selector, strainer):
+    """Return the href of every element matching a CSS selector"""
+    if HTMLParser is not None:
+        return [node.attributes.get('href') for node in HTMLParser(content).css(selector)]
+    soup = BeautifulSoup(content, "lxml", parse_only=strainer)
+    return [node.get('href') for node in soup.select(selector)]
+
+
+def search_bing(query, num_results=8, stop=None):
     """
     Search using Bing (scraping results page)
     No API key required
     """
-    try:
-        search_url = f"https://www.bing.com/search?q={urllib.parse.quote_plus(query)}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        
-        r = requests.get(search_url, headers=headers, timeout=15)
-        r.raise_for_status()
-        
-        soup = BeautifulSoup(r.text, "html.parser")
-        urls = []
-        
-        # Bing search results are in <li class="b_algo">
-        for result in soup.find_all('li', class_='b_algo'):
-            link = result.find('a')
-            if link and link.get('href'):
-                url = link['href']
-                if url.startswith('http'):
-                    urls.append(url)
+    search_url = f"https://www.bing.com/search?q={urllib.parse.quote_plus(query)}"
+    r = fetch(search_url, stop=stop, timeout=15)
+    r.raise_for_status()
+    
+    # Bing search results are in <li class="b_algo">; cite tags hold URLs too
+    if HTMLParser is not None:
+        tree = HTMLParser(r.content)
+        links = [result.css_first('a') for result in tree.css('li.b_algo')]
+        hrefs = [link.attributes.get('href') for link in links if link is not None]
+        cites = [cite.text() for cite in tree.css('cite')]
+    else:
+        soup = BeautifulSoup(r.content, "lxml", parse_only=BING_STRAINER)
+        links = [result.find('a') for result in soup.find_all('li', class_='b_algo')]
+        hrefs = [link.get('href') for link in links if link is not None]
+        cites = [cite.get_text() for cite in soup.find_all('cite')]
+    
+    urls = []
+    for url in hrefs:
+        if url and url.startswith('http'):
+            urls.append(url)
+            if len(urls) >= num_results:
+                break
+    
+    # Also try cite tags which contain URLs
+    if len(urls) < num_results:
+        for url_text in cites:
+            if url_text and not url_text.startswith('http'):
+                url_text = 'https://' + url_text
+            if url_text and url_text.startswith('http'):
+                cleaned = clean_url(url_text)
+                if cleaned and cleaned not in urls:
+                    urls.append(cleaned)
                     if len(urls) >= num_results:
                         break
-        
-        # Also try cite tags which contain URLs
-        if len(urls) < num_results:
-            for cite in soup.find_all('cite'):
-                url_text = cite.get_text()
-                if url_text and not url_text.startswith('http'):
-                    url_text = 'https://' + url_text
-                if url_text and url_text.startswith('http'):
-                    cleaned = clean_url(url_text)
-                    if cleaned and cleaned not in urls:
-                        urls.append(cleaned)
-                        if len(urls) >= num_results:
-                            break
-        
-        return urls
-    except Exception as e:
-        print(f"    Bing search failed: {e}")
-        return []
+    
+    return urls
 
 
-def search_startpage(query, num_results=8):
+def search_startpage(query, num_results=8, stop=None):
     """
     Search using Startpage (privacy-focused search engine)
     No API key required
     """
-    try:
-        search_url = f"https://www.startpage.com/do/search?q={urllib.parse.quote_plus(query)}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        
-        r = requests.get(search_url, headers=headers, timeout=15)
-        r.raise_for_status()
-        
-        soup = BeautifulSoup(r.text, "html.parser")
-        urls = []
-        
-        # Startpage results
-        for result in soup.find_all('a', class_='w-gl__result-url'):
-            url = result.get('href')
-            if url and url.startswith('http'):
-                urls.append(url)
-                if len(urls) >= num_results:
-                    break
-        
-        return urls
-    except Exception as e:
-        print(f"    Startpage search failed: {e}")
-        return []
+    search_url = f"https://www.startpage.com/do/search?q={urllib.parse.quote_plus(query)}"
+    r = fetch(search_url, stop=stop, timeout=15)
+    r.raise_for_status()
+    
+    urls = []
+    
+    # Startpage results
+    for url in select_hrefs(r.content, 'a.w-gl__result-url', ANCHOR_STRAINER):
+        if url and url.startswith('http'):
+            urls.append(url)
+            if len(urls) >= num_results:
+                break
+    
+    return urls
 
 
-def search_mojeek(query, num_results=8):
+def search_mojeek(query, num_results=8, stop=None):
     """
     Search using Mojeek (independent search engine)
     No API key required
     """
-    try:
-        search_url = f"https://www.mojeek.com/search?q={urllib.parse.quote_plus(query)}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        
-        r = requests.get(search_url, headers=headers, timeout=15)
-        r.raise_for_status()
-        
-        soup = BeautifulSoup(r.text, "html.parser")
-        urls = []
-        
-        # Mojeek results
-        for result in soup.find_all('a', class_='ob'):
-            url = result.get('href')
-            if url and url.startswith('http'):
-                urls.append(url)
-                if len(urls) >= num_results:
-                    break
-        
-        return urls
-    except Exception as e:
-        print(f"    Mojeek search failed: {e}")
-        return []
+    search_url = f"https://www.mojeek.com/search?q={urllib.parse.quote_plus(query)}"
+    r = fetch(search_url, stop=stop, timeout=15)
+    r.raise_for_status()
+    
+    urls = []
+    
+    # Mojeek results
+    for url in select_hrefs(r.content, 'a.ob', ANCHOR_STRAINER):
+        if url and url.startswith('http'):
+            urls.append(url)
+            if len(urls) >= num_results:
+                break
+    
+    return urls
+
+
+SEARCH_ENGINES = [
+    ("Bing", search_bing),  # most reliable for scraping
+    ("Startpage", search_startpage),
+    ("Mojeek", search_mojeek),
+]
 
 
 def search_web(conf_name, year, max_results=8):
@@ -186,84 +438,109 @@ def search_web(conf_name, year, max_results=8):
     No API keys required - safe for public repositories
     """
     query = f"{conf_name} {year} CFP call for papers"
-    print(f"    🔍 Web search: '{query}'")
     
-    all_urls = []
+    cache_key = ("search_web", conf_name, year)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        log(f"    🔍 Web search (cached): '{query}'")
+        return cached[:max_results]
     
-    # Try Bing first (most reliable for scraping)
-    print(f"      • Trying Bing...")
-    urls = search_bing(query, max_results)
-    if urls:
-        print(f"        ✓ Found {len(urls)} results")
-        all_urls.extend(urls)
-    else:
-        print(f"        ✗ No results")
+    log(f"    🔍 Web search: '{query}'")
     
-    # If we have enough URLs, return them
-    if len(all_urls) >= max_results:
-        return all_urls[:max_results]
+    # Query all engines at once (per-host limits are enforced by fetch).
+    # Once the preferred engine has answered and enough unique URLs are in,
+    # the rest are told to stop; requests already sent are waited for
+    preferred_engine = SEARCH_ENGINES[0][0]
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(SEARCH_ENGINES))
+    futures = {
+        executor.submit(search_fn, query, max_results, stop): engine
+        for engine, search_fn in SEARCH_ENGINES
+    }
+    results = {}
+    answered = set()
+    seen = set()
+    try:
+        for future in as_completed(futures):
+            engine = futures[future]
+            answered.add(engine)
+            try:
+                urls = future.result()
+            except Exception as e:
+                log(f"      • {engine} search failed: {e}")
+                urls = []
+            else:
+                if urls:
+                    log(f"      • {engine}: ✓ Found {len(urls)} results")
+                else:
+                    log(f"      • {engine}: ✗ No results")
+            results[engine] = urls
+            seen.update(filter(None, map(canonicalize_url, urls)))
+            if preferred_engine in answered and len(seen) >= max_results:
+                break
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
     
-    time.sleep(1)  # Rate limiting
+    # Merge in engine preference order and remove duplicates
+    unique_urls = dedupe_urls(
+        url for engine, _ in SEARCH_ENGINES for url in results.get(engine, [])
+    )
     
-    # Try Startpage as backup
-    print(f"      • Trying Startpage...")
-    urls = search_startpage(query, max_results - len(all_urls))
-    if urls:
-        print(f"        ✓ Found {len(urls)} results")
-        all_urls.extend(urls)
+    if unique_urls:
+        cache_set(cache_key, unique_urls)
     else:
-        print(f"        ✗ No results")
-    
-    # If still need more, try Mojeek
-    if len(all_urls) < max_results:
-        time.sleep(1)  # Rate limiting
-        print(f"      • Trying Mojeek...")
-        urls = search_mojeek(query, max_results - len(all_urls))
-        if urls:
-            print(f"        ✓ Found {len(urls)} results")
-            all_urls.extend(urls)
-        else:
-            print(f"        ✗ No results")
-    
-    # Remove duplicates
-    unique_urls = []
-    seen = set()
-    for url in all_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-    
-    if not unique_urls:
-        print(f"      ⚠ No search results found")
+        log(f"      ⚠ No search results found")
     
     return unique_urls[:max_results]
 
 
-def get_candidate_urls(conf_name, year, base_url=None):
+def known_homepage(conf_name, year):
+    """Return the known CFP URL for a conference and year, if there is one"""
+    template = KNOWN_HOMEPAGES.get(conf_name)
+    if not template:
+        return None
+    return template.format(year=year, yy=str(year)[2:])
+
+
+def get_candidate_urls(conf_name, year, base_url=None, use_search=True):
     """
     Generate candidate URLs to check for conference CFP
-    Priority: base_url with year update -> web search -> common patterns
+    Priority: known homepage -> base_url with year update -> web search -> common patterns
+    Web search is skipped for conferences with a known homepage, or when
+    use_search is False
     """
     urls = []
     
+    # Priority 0: Known homepage for well-known conferences
+    known_url = known_homepage(conf_name, year)
+    if known_url:
+        log(f"    📌 Known homepage: {known_url}")
+        urls.append(known_url)
+    
     # Priority 1: If base_url provided, try it with updated year
     if base_url:
-        print(f"    📌 Using base URL: {base_url}")
+        log(f"    📌 Using base URL: {base_url}")
         urls.append(base_url)
         
         # Try with updated year
         updated = update_year_in_url(base_url, year)
         if updated != base_url:
             urls.append(updated)
-            print(f"    📌 Year-updated URL: {updated}")
+            log(f"    📌 Year-updated URL: {updated}")
     
     # Priority 2: Web search for actual CFP pages
-    search_urls = search_web(conf_name, year, max_results=8)
-    urls.extend(search_urls)
+    if known_url:
+        log(f"    ⏭ Skipping web search (known homepage)")
+    elif not use_search:
+        log(f"    ⏭ Skipping web search (--no-search)")
+    else:
+        search_urls = search_web(conf_name, year, max_results=8)
+        urls.extend(search_urls)
     
     # Priority 3: Common URL patterns as final fallback
-    clean_name = re.sub(r'[^\w\s-]', '', conf_name.lower())
-    clean_name = re.sub(r'\s+', '', clean_name)
+    clean_name = NON_NAME_CHARS_PAT.sub('', conf_name.lower())
+    clean_name = WHITESPACE_PAT.sub('', clean_name)
     
     patterns = [
         f"https://{clean_name}{year}.org",
@@ -276,15 +553,28 @@ def get_candidate_urls(conf_name, year, base_url=None):
     urls.extend(patterns)
     
     # Remove duplicates and clean URLs
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        cleaned = clean_url(url)
-        if cleaned and cleaned not in seen:
-            seen.add(cleaned)
-            unique_urls.append(cleaned)
-    
-    return unique_urls
+    return dedupe_urls(urls)
+
+
+def _line_bounds(text, pos):
+    """Return the (start, end) offsets of the line containing pos"""
+    start = text.rfind('\n', 0, pos) + 1
+    end = text.find('\n', pos)
+    return start, len(text) if end == -1 else end
+
+
+def _keyword_in_range(positions, start, end):
+    """Check whether any sorted keyword offset falls within [start, end)"""
+    i = bisect.bisect_left(positions, start)
+    return i < len(positions) and positions[i] < end
+
+
+def _date_text(match):
+    """Turn a DATE_PATTERNS match into a date string; numeric dates become YYYY-MM-DD"""
+    if match.re is DATE_PAT_3:
+        year, month, day = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+    return ' '.join(x for x in match.groups() if x).strip()
 
 
 def extract_dates_from_text(text):
@@ -296,65 +586,77 @@ def extract_dates_from_text(text):
         "conference_end": None
     }
     
-    # Common date patterns
-    patterns = [
-        r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*,?\s+(\d{4})',
-        r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})',
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-    ]
+    # Clean text: replace em-dash and en-dash with regular dash
+    text = text.replace('—', '-').replace('–', '-').lower()
     
-    # Keywords to identify deadline types
-    abstract_keywords = ["abstract", "abstract deadline", "abstract due", "abstract submission", "paper abstract submission deadline"]
-    submission_keywords = ["submission deadline", "paper deadline", "full paper", "paper due", "submission due", "submissions due", "deadline:", "paper submission"]
-    conf_keywords = ["conference date", "event date", "will be held", "taking place", "conference:", "dates:"]
+    # Scan the whole text once per pattern instead of line by line; a date
+    # counts as a deadline when a deadline keyword appears on the same line
+    abstract_positions = [m.start() for m in ABSTRACT_KW_PAT.finditer(text)]
+    submission_positions = [m.start() for m in SUBMISSION_KW_PAT.finditer(text)]
     
-    # Clean text: replace em-dash and en-dash with regular dash
-    text = text.replace('—', '-').replace('–', '-')
-    lines = text.lower().split('\n')
+    def scan(pattern_idx, pattern):
+        for match in pattern.finditer(text):
+            start, end = _line_bounds(text, match.start())
+            yield (start, pattern_idx, match.start()), end, match
     
-    # Find ALL submission deadlines (for multiple cycles)
+    # Find ALL submission deadlines (for multiple cycles), walking the
+    # matches of every pattern in page order. Deadlines are listed roughly
+    # chronologically, so once enough future ones are seen the earliest
+    # is among them and the rest of the page can be skipped
+    now = datetime.now()
     all_deadlines = []
     all_abstract_deadlines = []
+    future_deadlines = []
     
-    for i, line in enumerate(lines):
+    scans = [scan(pattern_idx, pattern) for pattern_idx, pattern in enumerate(DATE_PATTERNS)]
+    for (start, _, _), end, match in heapq.merge(*scans, key=lambda item: item[0]):
+        date_str = _date_text(match)
+        
         # Abstract deadlines
-        if any(kw in line for kw in abstract_keywords):
-            for pattern in patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    date_str = ' '.join(str(x) for x in match if x).strip()
-                    all_abstract_deadlines.append(date_str)
+        if _keyword_in_range(abstract_positions, start, end):
+            all_abstract_deadlines.append(date_str)
         
         # Submission/CFP deadlines
-        if any(kw in line for kw in submission_keywords):
-            for pattern in patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    date_str = ' '.join(str(x) for x in match if x).strip()
-                    all_deadlines.append(date_str)
-        
-        # Conference dates
-        if any(kw in line for kw in conf_keywords) and not dates["conference_start"]:
-            context = ' '.join(lines[i:min(i+4, len(lines))])
-            for pattern in patterns:
-                matches = re.findall(pattern, context, re.IGNORECASE)
-                if len(matches) >= 1:
-                    dates["conference_start"] = ' '.join(str(x) for x in matches[0] if x).strip() if isinstance(matches[0], tuple) else matches[0]
-                if len(matches) >= 2:
-                    dates["conference_end"] = ' '.join(str(x) for x in matches[1] if x).strip() if isinstance(matches[1], tuple) else matches[1]
-                if dates["conference_start"]:
+        if _keyword_in_range(submission_positions, start, end):
+            all_deadlines.append(date_str)
+            deadline_date = parse_date_flexible(date_str)
+            if deadline_date and deadline_date >= now:
+                future_deadlines.append((deadline_date, date_str))
+                if len(future_deadlines) >= MAX_FUTURE_DEADLINES:
                     break
     
+    # Conference dates: look at the keyword line and the three lines after it
+    last_line_start = -1
+    for kw_match in CONF_KW_PAT.finditer(text):
+        start, _ = _line_bounds(text, kw_match.start())
+        if start == last_line_start:
+            continue
+        last_line_start = start
+        
+        end = start
+        for _ in range(4):
+            newline = text.find('\n', end)
+            if newline == -1:
+                end = len(text)
+                break
+            end = newline + 1
+        # The lines are joined, so a date may run across them here
+        context = text[start:end].replace('\n', ' ')
+        
+        for pattern in DATE_PATTERNS:
+            matches = [_date_text(m) for m in pattern.finditer(context)]
+            if len(matches) >= 1:
+                dates["conference_start"] = matches[0]
+            if len(matches) >= 2:
+                dates["conference_end"] = matches[1]
+            if dates["conference_start"]:
+                break
+        if dates["conference_start"]:
+            break
+    
     # Find the earliest FUTURE deadline from all found deadlines
-    now = datetime.now()
-    future_deadlines = []
     future_abstract_deadlines = []
     
-    for deadline_str in all_deadlines:
-        deadline_date = parse_date_flexible(deadline_str)
-        if deadline_date and deadline_date >= now:
-            future_deadlines.append((deadline_date, deadline_str))
-    
     for deadline_str in all_abstract_deadlines:
         deadline_date = parse_date_flexible(deadline_str)
         if deadline_date and deadline_date >= now:
@@ -377,105 +679,163 @@ def extract_dates_from_text(text):
     return dates
 
 
-def scrape_cfp_page(url):
-    """Scrape CFP page for CFP deadline, conference dates, and location"""
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        r = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-        r.raise_for_status()
-        
-        soup = BeautifulSoup(r.text, "html.parser")
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "noscript"]):
-            script.decompose()
-            
-        text = soup.get_text(separator="\n", strip=True)
-        
-        # Extract dates
-        dates = extract_dates_from_text(text)
-        
-        # Use abstract deadline if no CFP deadline found
-        if not dates["cfp_deadline"] and dates["abstract_deadline"]:
-            dates["cfp_deadline"] = dates["abstract_deadline"]
-        
-        cfp_deadline = dates["cfp_deadline"] or "TBA"
-        
-        # Check if this is a multi-cycle conference
-        cycle_keywords = ["cycle", "round", "deadline 1", "deadline 2", "spring", "fall", "summer", "winter"]
-        has_multiple_cycles = any(keyword in text.lower() for keyword in cycle_keywords)
+def parse_cfp_page(content, url):
+    """Extract CFP deadline, conference dates, and location from a page's HTML"""
+    soup = BeautifulSoup(content, "lxml")
+    
+    # Remove script and style elements
+    for script in soup(["script", "style", "noscript"]):
+        script.decompose()
         
-        # Conference dates
-        conf_dates = []
-        if dates["conference_start"]:
-            conf_dates.append(dates["conference_start"])
-        if dates["conference_end"] and dates["conference_end"] != dates["conference_start"]:
-            conf_dates.append(dates["conference_end"])
-        conference_dates = " to ".join(conf_dates) if conf_dates else "TBA"
+    text = soup.get_text(separator="\n", strip=True)[:MAX_TEXT_CHARS]
+    
+    # Extract dates
+    dates = extract_dates_from_text(text)
+    
+    # Use abstract deadline if no CFP deadline found
+    if not dates["cfp_deadline"] and dates["abstract_deadline"]:
+        dates["cfp_deadline"] = dates["abstract_deadline"]
+    
+    cfp_deadline = dates["cfp_deadline"] or "TBA"
+    
+    # Check if this is a multi-cycle conference
+    cycle_keywords = ["cycle", "round", "deadline 1", "deadline 2", "spring", "fall", "summer", "winter"]
+    has_multiple_cycles = any(keyword in text.lower() for keyword in cycle_keywords)
+    
+    # Conference dates
+    conf_dates = []
+    if dates["conference_start"]:
+        conf_dates.append(dates["conference_start"])
+    if dates["conference_end"] and dates["conference_end"] != dates["conference_start"]:
+        conf_dates.append(dates["conference_end"])
+    conference_dates = " to ".join(conf_dates) if conf_dates else "TBA"
+    
+    # Location extraction
+    location = "TBA"
+    for pattern in LOCATION_PATTERNS:
+        matches = pattern.findall(text[:5000])
+        if matches:
+            location = matches[0].strip()
+            location = WHITESPACE_PAT.sub(' ', location)
+            if len(location) > 50:
+                continue
+            break
+    
+    return {
+        "cfp_deadline": cfp_deadline,
+        "conference_dates": conference_dates,
+        "location": location,
+        "url": url,
+        "has_multiple_cycles": has_multiple_cycles
+    }
+
+
+def empty_page_info(url):
+    """Result for a page with no usable CFP information"""
+    return {
+        "cfp_deadline": "TBA",
+        "conference_dates": "TBA",
+        "location": "TBA",
+        "url": url,
+        "has_multiple_cycles": False
+    }
+
+
+def scrape_cfp_page(url, stop=None):
+    """
+    Scrape CFP page for CFP deadline, conference dates, and location
+    If the stop event gets set, the page is abandoned before the next
+    request or parse step and an empty result is returned (not cached)
+    """
+    cache_key = ("scrape_cfp_page", url)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    def stopped():
+        return stop is not None and stop.is_set()
+    
+    if stopped():
+        return empty_page_info(url)
+    
+    dead = False
+    try:
+        # The body is streamed, so keep the slot until it has been read
+        with LIMITER.slot(url):
+            # Waiting for the slot may take a while; re-check before fetching
+            if stopped():
+                return empty_page_info(url)
+            r = SESSION.get(url, timeout=15, allow_redirects=True, stream=True)
+            try:
+                # Status and content type are checked before any of the body
+                # is read, so dead links, PDFs, images, etc. cost one round trip
+                if r.status_code in DEAD_PAGE_STATUSES:
+                    dead = True
+                r.raise_for_status()
+                
+                content_type = r.headers.get("content-type", "")
+                if content_type and "html" not in content_type:
+                    dead = True
+                    raise ValueError(f"Not an HTML page: {content_type}")
+                
+                # Only the start of the page is needed; stop reading past the cap
+                chunks = []
+                size = 0
+                for chunk in r.iter_content(65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_PAGE_BYTES:
+                        break
+                content = b"".join(chunks)[:MAX_PAGE_BYTES]
+            finally:
+                r.close()
         
-        # Location extraction
-        location = "TBA"
-        location_patterns = [
-            r"(?:Location|Venue|City|Place)[:\-\s]+([A-Z][A-Za-z\s,]+(?:,\s*[A-Z]{2,})?)",
-            r"(?:held in|taking place in|will be in)\s+([A-Z][A-Za-z\s,]+)",
-        ]
+        if stopped():
+            return empty_page_info(url)
         
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text[:5000])
-            if matches:
-                location = matches[0].strip()
-                location = re.sub(r'\s+', ' ', location)
-                if len(location) > 50:
-                    continue
-                break
+        # Parsing is CPU-bound, so it runs in the process pool when there is one
+        if _parse_pool is not None:
+            info = _parse_pool.submit(parse_cfp_page, content, url).result()
+        else:
+            info = parse_cfp_page(content, url)
         
-        return {
-            "cfp_deadline": cfp_deadline,
-            "conference_dates": conference_dates,
-            "location": location,
-            "url": url,
-            "has_multiple_cycles": has_multiple_cycles
-        }
+        cache_set(cache_key, info)
+        return info
     except Exception as e:
-        return {
-            "cfp_deadline": "TBA",
-            "conference_dates": "TBA",
-            "location": "TBA",
-            "url": url,
-            "has_multiple_cycles": False
-        }
+        info = empty_page_info(url)
+        # Remember URLs that are gone or not HTML so they are not fetched
+        # again; other failures may be transient and are retried next time
+        if dead:
+            cache_set(cache_key, info)
+        return info
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_date_flexible(date_str):
     """Parse various date formats and return datetime object"""
     if not date_str or date_str == "TBA":
         return None
     
-    date_str = re.sub(r'\s+', ' ', date_str.strip())
+    date_str = WHITESPACE_PAT.sub(' ', date_str.strip())
     
-    formats = [
-        "%d %B %Y", "%d %b %Y",
-        "%B %d %Y", "%b %d %Y",
-        "%d-%B-%Y", "%d-%b-%Y",
-        "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
-        "%A, %d %B %Y", "%A, %B %d %Y",
-    ]
+    # Fast path for ISO dates, which fromisoformat parses much faster than strptime
+    if ISO_DATE_PAT.fullmatch(date_str):
+        try:
+            return datetime.fromisoformat(date_str.replace('/', '-'))
+        except ValueError:
+            pass
     
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
     
     # Try extracting just the date part
-    for pattern in [r"(\d{1,2}\s+\w+\s+\d{4})", r"(\w+\s+\d{1,2}\s+\d{4})"]:
-        match = re.search(pattern, date_str)
+    for pattern in DATE_PART_PATTERNS:
+        match = pattern.search(date_str)
         if match:
-            for fmt in formats:
+            for fmt in SPACED_DATE_FORMATS:
                 try:
                     return datetime.strptime(match.group(1), fmt)
                 except ValueError:
@@ -496,7 +856,122 @@ def is_past_deadline(cfp_deadline):
 # MAIN
 # ----------------------------
 
+def process_conference(idx, total, conf, use_search=True):
+    """Find CFP and conference date information for a single conference"""
+    name = conf.get("name", "Unknown")
+    core_rank = conf.get("core_rank", "TBA")
+    base_url = conf.get("base_url")
+    
+    log(f"\n[{idx}/{total}] 🎯 Processing: {name}")
+    
+    current_year = YEAR
+    cfp_info = None
+    best_url = "TBA"
+    
+    # Try current year, then next year if deadline has passed
+    for attempt in range(2):
+        year_to_search = current_year + attempt
+        log(f"  📅 Searching for {year_to_search}...")
+        
+        # Get potential URLs (base_url + web search + patterns)
+        urls = get_candidate_urls(name, year_to_search, base_url, use_search)
+        
+        if not urls:
+            log(f"    ⚠ No URLs found to try")
+            continue
+        
+        # Try each URL: a few candidates are fetched at a time but checked
+        # in priority order, so the first candidate with a deadline still wins
+        candidates = urls[:10]  # Limit to first 10 URLs
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS)
+        futures = [executor.submit(scrape_cfp_page, url, stop) for url in candidates]
+        found = False
+        try:
+            for url_idx, (url, future) in enumerate(zip(candidates, futures), 1):
+                log(f"    [{url_idx}] Trying: {url[:70]}...")
+                
+                cfp_info = future.result()
+                
+                if cfp_info["cfp_deadline"] != "TBA":
+                    best_url = url
+                    found = True
+                    
+                    # Check if deadline has passed
+                    if is_past_deadline(cfp_info["cfp_deadline"]) and attempt == 0:
+                        log(f"         ⏰ Deadline passed ({cfp_info['cfp_deadline']}), trying next year...")
+                        break  # Try next year
+                    else:
+                        cycle_note = " (earliest cycle)" if cfp_info.get("has_multiple_cycles") else ""
+                        log(f"         ✅ CFP deadline: {cfp_info['cfp_deadline']}{cycle_note}")
+                        if cfp_info["conference_dates"] != "TBA":
+                            log(f"         ✅ Conference: {cfp_info['conference_dates']}")
+                        if cfp_info["location"] != "TBA":
+                            log(f"         ✅ Location: {cfp_info['location']}")
+                        break  # Success!
+        finally:
+            # Drop queued candidates, tell running ones to give up, and wait
+            # for them so nothing outlives this attempt
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        if found and not is_past_deadline(cfp_info.get("cfp_deadline", "TBA")):
+            break  # Found valid future deadline
+    
+    # If still no info, create default entry
+    if not cfp_info or cfp_info["cfp_deadline"] == "TBA":
+        log(f"    ❌ No CFP information found")
+        cfp_info = {
+            "cfp_deadline": "TBA",
+            "conference_dates": "TBA",
+            "location": "TBA"
+        }
+    
+    cfp_note = "Earliest deadline from multiple cycles" if cfp_info.get("has_multiple_cycles") else ""
+    
+    cfp_entry = {
+        "name": name,
+        "core_rank": core_rank,
+        "cfp_deadline": cfp_info["cfp_deadline"],
+        "cfp_url": best_url,
+        "note": cfp_note
+    }
+    
+    dates_entry = {
+        "name": name,
+        "location": cfp_info["location"],
+        "conference_dates": cfp_info["conference_dates"],
+        "conf_url": best_url
+    }
+    
+    return cfp_entry, dates_entry
+
+
+def process_conference_buffered(idx, total, conf, use_search=True):
+    """Run process_conference, printing its output as one uninterrupted block"""
+    _log_state.lines = []
+    try:
+        return process_conference(idx, total, conf, use_search)
+    finally:
+        lines, _log_state.lines = _log_state.lines, None
+        with _print_lock:
+            print("\n".join(lines))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch conference CFP deadlines and dates")
+    parser.add_argument(
+        "--no-search",
+        action="store_true",
+        help="skip web search; only try known homepages, base URLs and URL patterns",
+    )
+    return parser.parse_args()
+
+
 def main():
+    global _parse_pool
+    args = parse_args()
+    
     # Load conferences
     try:
         with open(INPUT_FILE) as f:
@@ -518,94 +993,31 @@ def main():
     print("🚀 Starting conference CFP scraping...")
     print("="*70)
     
-    for idx, conf in enumerate(conferences, 1):
-        name = conf.get("name", "Unknown")
-        core_rank = conf.get("core_rank", "TBA")
-        base_url = conf.get("base_url")
-        
-        print(f"\n[{idx}/{len(conferences)}] 🎯 Processing: {name}")
-        
-        current_year = YEAR
-        cfp_info = None
-        best_url = "TBA"
-        
-        # Try current year, then next year if deadline has passed
-        for attempt in range(2):
-            year_to_search = current_year + attempt
-            print(f"  📅 Searching for {year_to_search}...")
-            
-            # Get potential URLs (base_url + web search + patterns)
-            urls = get_candidate_urls(name, year_to_search, base_url)
-            
-            if not urls:
-                print(f"    ⚠ No URLs found to try")
-                continue
-            
-            # Try each URL
-            found = False
-            for url_idx, url in enumerate(urls[:10], 1):  # Limit to first 10 URLs
-                print(f"    [{url_idx}] Trying: {url[:70]}...")
-                
-                cfp_info = scrape_cfp_page(url)
-                
-                if cfp_info["cfp_deadline"] != "TBA":
-                    best_url = url
-                    found = True
-                    
-                    # Check if deadline has passed
-                    if is_past_deadline(cfp_info["cfp_deadline"]) and attempt == 0:
-                        print(f"         ⏰ Deadline passed ({cfp_info['cfp_deadline']}), trying next year...")
-                        break  # Try next year
-                    else:
-                        cycle_note = " (earliest cycle)" if cfp_info.get("has_multiple_cycles") else ""
-                        print(f"         ✅ CFP deadline: {cfp_info['cfp_deadline']}{cycle_note}")
-                        if cfp_info["conference_dates"] != "TBA":
-                            print(f"         ✅ Conference: {cfp_info['conference_dates']}")
-                        if cfp_info["location"] != "TBA":
-                            print(f"         ✅ Location: {cfp_info['location']}")
-                        break  # Success!
-                
-                time.sleep(0.5)  # Rate limiting
-            
-            if found and not is_past_deadline(cfp_info.get("cfp_deadline", "TBA")):
-                break  # Found valid future deadline
-        
-        # If still no info, create default entry
-        if not cfp_info or cfp_info["cfp_deadline"] == "TBA":
-            print(f"    ❌ No CFP information found")
-            cfp_info = {
-                "cfp_deadline": "TBA",
-                "conference_dates": "TBA",
-                "location": "TBA"
-            }
-        
-        # Append outputs
-        cfp_note = "Earliest deadline from multiple cycles" if cfp_info.get("has_multiple_cycles") else ""
-        
-        cfp_out.append({
-            "name": name,
-            "core_rank": core_rank,
-            "cfp_deadline": cfp_info["cfp_deadline"],
-            "cfp_url": best_url,
-            "note": cfp_note
-        })
-        
-        dates_out.append({
-            "name": name,
-            "location": cfp_info["location"],
-            "conference_dates": cfp_info["conference_dates"],
-            "conf_url": best_url
-        })
+    # Workers are spawned rather than forked, as the parent already has
+    # threads (and their locks) running by the time pages are parsed
+    _parse_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    with _parse_pool, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(process_conference_buffered, idx, len(conferences), conf, not args.no_search)
+            for idx, conf in enumerate(conferences, 1)
+        ]
+        for future in futures:
+            cfp_entry, dates_entry = future.result()
+            cfp_out.append(cfp_entry)
+            dates_out.append(dates_entry)
     
     # Write JSON files
     cfp_output_file = OUTPUT_DIR / "cfp.json"
     dates_output_file = OUTPUT_DIR / "confdates.json"
     
-    with open(cfp_output_file, "w") as f:
-        json.dump(cfp_out, f, indent=2)
+    with open(cfp_output_file, "wb") as f:
+        f.write(orjson.dumps(cfp_out, option=orjson.OPT_INDENT_2))
     
-    with open(dates_output_file, "w") as f:
-        json.dump(dates_out, f, indent=2)
+    with open(dates_output_file, "wb") as f:
+        f.write(orjson.dumps(dates_out, option=orjson.OPT_INDENT_2))
     
     print(f"\n{'='*70}")
     print(f"✅ Conference data updated successfully!")